@@ -22,18 +22,160 @@ Usage:
     )
 """
 
+import asyncio
 import os
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+import uuid
+import weakref
+from collections import ChainMap, OrderedDict
+from functools import partial
+from types import MappingProxyType
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
 
 import httpx
+import msgspec
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
+# Sentinel pushed onto the event queue to stop the background flusher.
+_SHUTDOWN = object()
+
+# Upper bound on remembered (type, action, context) fingerprints when
+# deduplication is enabled.
+_DEDUP_MAX_ENTRIES = 1024
+
+# Immutable templates shared by every instance, so __init__ does not
+# rebuild identical dicts per observer.
+_HEADER_TEMPLATE = MappingProxyType({"Content-Type": "application/json"})
+_EMPTY_METADATA: Any = MappingProxyType({})
 
-@dataclass
+
+def _shutdown_flusher(event_queue: "queue.Queue[Any]", thread: threading.Thread) -> None:
+    """Ask the flusher thread to drain its queue and stop.
+
+    Module-level so weakref.finalize can call it without keeping the
+    observer alive.
+    """
+    event_queue.put(_SHUTDOWN)
+    thread.join(timeout=10.0)
+
+# Shared pool sizing for every observer in the process. With HTTP/2 the
+# flusher multiplexes concurrent POSTs over a single keep-alive TLS
+# connection instead of paying a TCP+TLS handshake per request.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=90,
+)
+
+# Millisecond-granularity timestamp cache: back-to-back callbacks within
+# the same millisecond reuse the formatted string instead of building a
+# datetime and re-formatting it.
+_ts_cache: list = [0, ""]
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO-8601, cached to 1ms."""
+    ns = time.time_ns()
+    if ns - _ts_cache[0] > 1_000_000:
+        _ts_cache[0] = ns
+        _ts_cache[1] = datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+    return _ts_cache[1]
+
+
+# Per-type serializer cache: the probe ladder below runs once per type
+# encountered, after which encoding an instance is a single dict hit.
+_FALLBACK_BY_TYPE: Dict[type, Any] = {}
+
+
+def _default_fallback(obj: Any) -> Any:
+    """Last-resort conversion: instance __dict__, else str()."""
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        return d
+    return str(obj)
+
+
+def _select_fallback(tp: type) -> Any:
+    """Pick the fastest native conversion for a type.
+
+    Pydantic v2 models go through model_dump_json(), whose C-implemented
+    encoder is far faster than .dict() plus a re-walk; its output is
+    spliced into the payload verbatim via msgspec.Raw. Dataclasses and
+    attrs classes are encoded natively by msgspec and never reach this
+    hook.
+    """
+    if hasattr(tp, "model_dump_json"):
+        return lambda obj: msgspec.Raw(obj.model_dump_json().encode())
+    if hasattr(tp, "dict"):
+        return lambda obj: obj.dict()
+    return _default_fallback
+
+
+def _json_fallback(obj: Any) -> Any:
+    """Convert objects msgspec cannot encode natively.
+
+    msgspec handles dicts, lists, primitives, datetimes and UUIDs in C;
+    this hook is only invoked for the remaining leaves.
+    """
+    if isinstance(obj, ChainMap):
+        return dict(obj)
+    tp = type(obj)
+    convert = _FALLBACK_BY_TYPE.get(tp)
+    if convert is None:
+        convert = _select_fallback(tp)
+        _FALLBACK_BY_TYPE[tp] = convert
+    return convert(obj)
+
+
+class DecisionPayload(msgspec.Struct, gc=False, omit_defaults=True):
+    """Wire format for a decision create event.
+
+    Declared once so the field layout is compiled instead of re-hashed as
+    a dict per event; gc=False keeps these short-lived structs out of the
+    cycle collector.
+    """
+
+    id: str
+    agent_id: str
+    type: str
+    action: str
+    status: str
+    context: Any
+    result: Optional[Dict[str, Any]] = None
+
+
+def _truncate(obj: Any, n: int) -> Optional[str]:
+    """Bound an object's string form to at most n characters.
+
+    Strings are sliced without materializing anything new; other objects
+    are stringified at most once, and anything whose representation blows
+    far past the budget is summarized by type name so a multi-megabyte
+    tool output never lands in the payload.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, str):
+        return obj if len(obj) <= n else obj[:n]
+    if isinstance(obj, (bytes, bytearray)):
+        return bytes(obj[:n]).decode("utf-8", "replace")
+    s = str(obj)
+    if len(s) > n * 10:
+        return f"{type(obj).__name__}(...)"
+    return s[:n]
+
+
+@dataclass(slots=True)
 class TaskEvent:
     """Represents a CrewAI task event."""
     task_id: str
@@ -58,6 +200,34 @@ class ContextGraphObserver:
     Each captured event is logged with full context for audit trails.
     """
 
+    _SOURCE = "crewai"
+
+    # Fixed-slot storage: cheaper attribute access on the hot callback
+    # path and no per-instance __dict__.
+    __slots__ = (
+        "api_key",
+        "crew_id",
+        "api_url",
+        "log_tool_calls",
+        "log_agent_thoughts",
+        "auto_approve",
+        "metadata",
+        "batch_window_ms",
+        "batch_max_size",
+        "dedup_ttl_seconds",
+        "_dedup",
+        "_static_ctx",
+        "_headers",
+        "_queue",
+        "_flusher_thread",
+        "_finalizer",
+        "_active_decisions",
+        "_crew_decision_id",
+        "_agent_ids",
+        "_task_ids",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -67,6 +237,9 @@ class ContextGraphObserver:
         log_agent_thoughts: bool = True,
         auto_approve: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        batch_window_ms: int = 50,
+        batch_max_size: int = 64,
+        dedup_ttl_seconds: float = 0.0,
     ):
         """
         Initialize the ContextGraph observer.
@@ -79,6 +252,10 @@ class ContextGraphObserver:
             log_agent_thoughts: Whether to log agent reasoning/thoughts.
             auto_approve: Automatically approve decisions (for testing).
             metadata: Additional metadata to include with all decisions.
+            batch_window_ms: How long the background flusher waits to fill a batch.
+            batch_max_size: Maximum number of events sent in one batch POST.
+            dedup_ttl_seconds: Reuse the decision ID for identical events seen
+                within this window instead of logging again. 0 disables.
         """
         self.api_key = api_key or os.environ.get("CG_API_KEY")
         self.crew_id = crew_id or os.environ.get("CG_CREW_ID")
@@ -86,7 +263,7 @@ class ContextGraphObserver:
         self.log_tool_calls = log_tool_calls
         self.log_agent_thoughts = log_agent_thoughts
         self.auto_approve = auto_approve
-        self.metadata = metadata or {}
+        self.metadata = dict(metadata) if metadata else _EMPTY_METADATA
 
         if not self.api_key:
             raise ValueError(
@@ -97,19 +274,76 @@ class ContextGraphObserver:
                 "ContextGraph crew ID required. Set CG_CREW_ID env var or pass crew_id."
             )
 
-        self._client = httpx.Client(
-            base_url=self.api_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
+        # Static context fields are merged once; per-event contexts layer on
+        # top via ChainMap instead of copying this dict for every decision.
+        self._static_ctx = {**self.metadata, "source": self._SOURCE}
+
+        self._headers = {**_HEADER_TEMPLATE, "Authorization": f"Bearer {self.api_key}"}
+        self.batch_window_ms = batch_window_ms
+        self.batch_max_size = batch_max_size
+        self.dedup_ttl_seconds = dedup_ttl_seconds
+        self._dedup: "OrderedDict[int, tuple]" = OrderedDict()
+
+        # Events are enqueued here and flushed in batches by a background
+        # thread, so callbacks never block the agent loop on network I/O.
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._flusher_thread = threading.Thread(
+            target=self._run_flusher,
+            name="contextgraph-flusher",
+            daemon=True,
+        )
+        self._flusher_thread.start()
+
+        # Deterministic cleanup: runs on close(), garbage collection, or
+        # interpreter exit, whichever comes first.
+        self._finalizer = weakref.finalize(
+            self, _shutdown_flusher, self._queue, self._flusher_thread
         )
 
-        # Track active decisions by task/agent
-        self._active_decisions: Dict[str, str] = {}
+        # Track active decisions keyed by id(task)/id(agent): int keys hash
+        # by identity and need no string conversion on lookup.
+        self._active_decisions: Dict[int, str] = {}
         self._crew_decision_id: Optional[str] = None
 
+        # Memoized identity strings, keyed weakly by the agent/task object
+        # so entries disappear with the objects they describe.
+        self._agent_ids: "weakref.WeakKeyDictionary[Any, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._task_ids: "weakref.WeakKeyDictionary[Any, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _dedup_key(self, decision_type: str, action: str, context: Dict[str, Any]) -> int:
+        """Fingerprint an event by type, action and canonical context."""
+        return hash(
+            (
+                decision_type,
+                action,
+                msgspec.json.encode(
+                    context, enc_hook=_json_fallback, order="deterministic"
+                ),
+            )
+        )
+
+    def _dedup_lookup(self, key: int) -> Optional[str]:
+        """Return a live cached decision ID for this fingerprint, if any."""
+        cached = self._dedup.get(key)
+        if cached is None:
+            return None
+        decision_id, expires = cached
+        if expires < time.monotonic():
+            del self._dedup[key]
+            return None
+        self._dedup.move_to_end(key)
+        return decision_id
+
+    def _dedup_store(self, key: int, decision_id: str) -> None:
+        """Remember a decision ID for this fingerprint, evicting LRU-style."""
+        self._dedup[key] = (decision_id, time.monotonic() + self.dedup_ttl_seconds)
+        while len(self._dedup) > _DEDUP_MAX_ENTRIES:
+            self._dedup.popitem(last=False)
+
     def _log_decision(
         self,
         decision_type: str,
@@ -117,55 +351,215 @@ class ContextGraphObserver:
         context: Dict[str, Any],
         reference_id: Optional[str] = None,
     ) -> Optional[str]:
-        """Log a decision to ContextGraph."""
-        try:
-            payload = {
-                "agent_id": self.crew_id,
-                "type": decision_type,
-                "action": action,
-                "status": "proposed",
-                "context": {
-                    **context,
-                    **self.metadata,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "source": "crewai",
-                },
-            }
+        """Enqueue a decision for batched delivery to ContextGraph."""
+        if self.dedup_ttl_seconds > 0:
+            dedup_key = self._dedup_key(decision_type, action, context)
+            cached = self._dedup_lookup(dedup_key)
+            if cached is not None:
+                return cached
+
+        # IDs are minted client-side so callers can track the decision
+        # immediately without waiting for a server round trip.
+        decision_id = str(uuid.uuid4())
+
+        payload = DecisionPayload(
+            id=decision_id,
+            agent_id=self.crew_id,
+            type=decision_type,
+            action=action,
+            status="proposed",
+            context=ChainMap(
+                {"timestamp": _iso_now()},
+                self._static_ctx,
+                context,
+            ),
+        )
 
-            if reference_id:
-                payload["context"]["reference_id"] = reference_id
+        if reference_id:
+            payload.context["reference_id"] = reference_id
 
-            response = self._client.post("/v1/decisions", json=payload)
-            response.raise_for_status()
+        self._queue.put({"op": "create", "payload": payload})
 
-            decision = response.json()
-            decision_id = decision.get("id")
+        if self.dedup_ttl_seconds > 0:
+            self._dedup_store(dedup_key, decision_id)
 
-            if self.auto_approve and decision_id:
-                self._transition_decision(decision_id, "approved")
+        if self.auto_approve:
+            self._transition_decision(decision_id, "approved")
 
-            return decision_id
+        return decision_id
 
-        except Exception as e:
-            logger.error(f"Failed to log decision to ContextGraph: {e}")
-            return None
+    def _log_terminal_decision(
+        self,
+        decision_type: str,
+        action: str,
+        context: Dict[str, Any],
+        status: str,
+        result: Optional[Dict] = None,
+    ) -> Optional[str]:
+        """Enqueue a decision that is already in a terminal state.
+
+        Callbacks that observe the outcome together with the invocation
+        (e.g. ``on_tool_use``) don't need the proposed->executed transition
+        pair; one event with the final status halves the request count.
+        """
+        if self.dedup_ttl_seconds > 0:
+            dedup_key = self._dedup_key(decision_type, action, context)
+            cached = self._dedup_lookup(dedup_key)
+            if cached is not None:
+                return cached
+
+        decision_id = str(uuid.uuid4())
+
+        payload = DecisionPayload(
+            id=decision_id,
+            agent_id=self.crew_id,
+            type=decision_type,
+            action=action,
+            status=status,
+            context=ChainMap(
+                {"timestamp": _iso_now()},
+                self._static_ctx,
+                context,
+            ),
+            result=result,
+        )
+
+        self._queue.put({"op": "create", "payload": payload})
+
+        if self.dedup_ttl_seconds > 0:
+            self._dedup_store(dedup_key, decision_id)
+
+        return decision_id
 
     def _transition_decision(
         self, decision_id: str, status: str, result: Optional[Dict] = None
     ):
-        """Transition a decision to a new status."""
-        try:
-            payload = {"status": status}
-            if result:
-                payload["result"] = result
+        """Enqueue a decision status transition for batched delivery.
 
-            response = self._client.post(
-                f"/v1/decisions/{decision_id}/transition", json=payload
-            )
-            response.raise_for_status()
+        Fire-and-forget: the caller returns immediately and the background
+        flusher performs the POST, so transitions never extend callback
+        latency.
+        """
+        payload = {"status": status}
+        if result:
+            payload["result"] = result
+
+        self._queue.put(
+            {"op": "transition", "decision_id": decision_id, "payload": payload}
+        )
+
+    # ==================== Background Flusher ====================
+
+    def _run_flusher(self) -> None:
+        """Entry point for the background flusher thread."""
+        if uvloop is not None:
+            # libuv-based loop: much lower per-socket overhead than the
+            # default selector loop. Created per-thread rather than via
+            # uvloop.install() so the host application's loop policy is
+            # left alone.
+            loop = uvloop.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self._flusher())
+            finally:
+                loop.close()
+        else:
+            asyncio.run(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain the event queue and POST batches until shutdown."""
+        async with httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=self._headers,
+            timeout=30.0,
+            http2=True,
+            limits=_POOL_LIMITS,
+        ) as client:
+            # Bind the hot POST once: no client.post attribute resolution
+            # or URL parsing per flush.
+            post_batch = partial(client.post, "/v1/decisions:batch")
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                try:
+                    await self._post_batch(post_batch, batch)
+                except Exception as e:
+                    logger.error(f"Failed to flush batch to ContextGraph: {e}")
+
+    def _next_batch(self) -> Optional[List[Dict[str, Any]]]:
+        """Block for the next batch of events, or None on shutdown."""
+        event = self._queue.get()
+        if event is _SHUTDOWN:
+            return None
+
+        batch = [event]
+        deadline = time.monotonic() + self.batch_window_ms / 1000.0
+
+        while len(batch) < self.batch_max_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _SHUTDOWN:
+                # Put the sentinel back so the next iteration shuts down
+                # after this batch has been flushed.
+                self._queue.put(_SHUTDOWN)
+                break
+            batch.append(event)
+
+        return batch
+
+    async def _post_batch(self, post_batch: Any, batch: List[Dict[str, Any]]) -> None:
+        """POST one queue drain to ContextGraph as a single request.
+
+        Creates and transitions go in one array payload, serialized with a
+        single encode call so there is one Python-to-C crossing and one
+        output buffer per drain; the server applies the items in order.
+        """
+        response = await post_batch(
+            content=msgspec.json.encode(batch, enc_hook=_json_fallback)
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        """Flush pending events and stop the background flusher."""
+        self._finalizer()
 
-        except Exception as e:
-            logger.error(f"Failed to transition decision {decision_id}: {e}")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _agent_key(self, agent: Any) -> tuple:
+        """Return the memoized (role, reference id) pair for an agent."""
+        try:
+            return self._agent_ids[agent]
+        except (KeyError, TypeError):
+            name = getattr(agent, "role", "unknown_agent")
+            key = (name, f"{name}_{id(agent)}")
+            try:
+                self._agent_ids[agent] = key
+            except TypeError:
+                # Objects that don't support weak references aren't cached.
+                pass
+            return key
+
+    def _task_key(self, task: Any) -> str:
+        """Return the memoized identity string for a task."""
+        try:
+            return self._task_ids[task]
+        except (KeyError, TypeError):
+            key = str(id(task))
+            try:
+                self._task_ids[task] = key
+            except TypeError:
+                pass
+            return key
 
     # ==================== Crew Callbacks ====================
 
@@ -181,7 +575,7 @@ class ContextGraphObserver:
         tasks = []
         if hasattr(crew, "tasks"):
             tasks = [
-                {"description": t.description[:200] if t.description else None}
+                {"description": _truncate(t.description, 200)}
                 for t in crew.tasks
             ]
 
@@ -204,7 +598,7 @@ class ContextGraphObserver:
                 self._crew_decision_id,
                 "executed",
                 result={
-                    "output": str(output)[:5000] if output else None,
+                    "output": _truncate(output, 5000),
                     "success": True,
                 },
             )
@@ -224,42 +618,39 @@ class ContextGraphObserver:
 
     def on_task_start(self, task: Any, agent: Any) -> None:
         """Called when a task starts."""
-        task_id = str(id(task))
-        agent_name = getattr(agent, "role", "unknown_agent")
+        agent_name = self._agent_key(agent)[0]
 
         decision_id = self._log_decision(
             decision_type="task_execution",
             action="execute_task",
             context={
-                "task_description": getattr(task, "description", "")[:500],
-                "expected_output": getattr(task, "expected_output", "")[:500],
+                "task_description": _truncate(getattr(task, "description", ""), 500),
+                "expected_output": _truncate(getattr(task, "expected_output", ""), 500),
                 "agent_name": agent_name,
                 "agent_goal": getattr(agent, "goal", None),
             },
-            reference_id=task_id,
+            reference_id=self._task_key(task),
         )
 
         if decision_id:
-            self._active_decisions[task_id] = decision_id
+            self._active_decisions[id(task)] = decision_id
 
     def on_task_end(self, task: Any, output: Any) -> None:
         """Called when a task completes."""
-        task_id = str(id(task))
-        decision_id = self._active_decisions.pop(task_id, None)
+        decision_id = self._active_decisions.pop(id(task), None)
 
         if decision_id:
             self._transition_decision(
                 decision_id,
                 "executed",
                 result={
-                    "output": str(output)[:5000] if output else None,
+                    "output": _truncate(output, 5000),
                 },
             )
 
     def on_task_error(self, task: Any, error: Exception) -> None:
         """Called when a task fails."""
-        task_id = str(id(task))
-        decision_id = self._active_decisions.pop(task_id, None)
+        decision_id = self._active_decisions.pop(id(task), None)
 
         if decision_id:
             self._transition_decision(
@@ -272,8 +663,7 @@ class ContextGraphObserver:
 
     def on_agent_action(self, agent: Any, action: str, action_input: Any) -> None:
         """Called when an agent takes an action."""
-        agent_name = getattr(agent, "role", "unknown_agent")
-        agent_id = f"{agent_name}_{id(agent)}"
+        agent_name, agent_id = self._agent_key(agent)
 
         decision_id = self._log_decision(
             decision_type="agent_action",
@@ -281,25 +671,23 @@ class ContextGraphObserver:
             context={
                 "agent_name": agent_name,
                 "action": action,
-                "action_input": self._serialize(action_input),
+                "action_input": action_input,
             },
             reference_id=agent_id,
         )
 
         if decision_id:
-            self._active_decisions[f"action_{agent_id}"] = decision_id
+            self._active_decisions[id(agent)] = decision_id
 
     def on_agent_finish(self, agent: Any, output: Any) -> None:
         """Called when an agent finishes an action."""
-        agent_name = getattr(agent, "role", "unknown_agent")
-        agent_id = f"{agent_name}_{id(agent)}"
-        decision_id = self._active_decisions.pop(f"action_{agent_id}", None)
+        decision_id = self._active_decisions.pop(id(agent), None)
 
         if decision_id:
             self._transition_decision(
                 decision_id,
                 "executed",
-                result={"output": self._serialize(output)},
+                result={"output": output},
             )
 
     # ==================== Tool Callbacks ====================
@@ -311,23 +699,21 @@ class ContextGraphObserver:
         if not self.log_tool_calls:
             return
 
-        agent_name = getattr(agent, "role", "unknown_agent")
+        agent_name = self._agent_key(agent)[0]
 
-        decision_id = self._log_decision(
+        # Tool calls are instantaneous, so log them directly as executed.
+        self._log_terminal_decision(
             decision_type="tool_usage",
             action=tool_name,
             context={
                 "agent_name": agent_name,
                 "tool_name": tool_name,
-                "tool_input": self._serialize(tool_input),
-                "tool_output": self._serialize(tool_output)[:2000],
+                "tool_input": tool_input,
+                "tool_output": _truncate(tool_output, 2000),
             },
+            status="executed",
         )
 
-        # Tool calls are instantaneous, so immediately mark as executed
-        if decision_id:
-            self._transition_decision(decision_id, "executed")
-
     def on_tool_error(
         self, agent: Any, tool_name: str, tool_input: Any, error: Exception
     ) -> None:
@@ -335,25 +721,20 @@ class ContextGraphObserver:
         if not self.log_tool_calls:
             return
 
-        agent_name = getattr(agent, "role", "unknown_agent")
+        agent_name = self._agent_key(agent)[0]
 
-        decision_id = self._log_decision(
+        self._log_terminal_decision(
             decision_type="tool_usage",
             action=tool_name,
             context={
                 "agent_name": agent_name,
                 "tool_name": tool_name,
-                "tool_input": self._serialize(tool_input),
+                "tool_input": tool_input,
             },
+            status="failed",
+            result={"error": str(error)},
         )
 
-        if decision_id:
-            self._transition_decision(
-                decision_id,
-                "failed",
-                result={"error": str(error)},
-            )
-
     # ==================== Thought Callbacks ====================
 
     def on_agent_thought(self, agent: Any, thought: str) -> None:
@@ -361,40 +742,17 @@ class ContextGraphObserver:
         if not self.log_agent_thoughts:
             return
 
-        agent_name = getattr(agent, "role", "unknown_agent")
+        agent_name = self._agent_key(agent)[0]
 
         self._log_decision(
             decision_type="agent_reasoning",
             action="think",
             context={
                 "agent_name": agent_name,
-                "thought": thought[:2000],
+                "thought": _truncate(thought, 2000),
             },
         )
 
-    # ==================== Utilities ====================
-
-    def _serialize(self, obj: Any) -> Any:
-        """Serialize object for JSON."""
-        if obj is None:
-            return None
-        if isinstance(obj, (str, int, float, bool)):
-            return obj
-        if isinstance(obj, dict):
-            return {k: self._serialize(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple)):
-            return [self._serialize(v) for v in obj]
-        if hasattr(obj, "dict"):
-            return self._serialize(obj.dict())
-        if hasattr(obj, "__dict__"):
-            return self._serialize(obj.__dict__)
-        return str(obj)
-
-    def __del__(self):
-        """Cleanup HTTP client."""
-        if hasattr(self, "_client"):
-            self._client.close()
-
 
 # Convenience function for CrewAI integration
 def create_observer(**kwargs) -> ContextGraphObserver:
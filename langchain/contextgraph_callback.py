@@ -22,14 +22,29 @@ Usage:
     )
 """
 
+import asyncio
 import os
 import json
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+import uuid
+import weakref
+from collections import ChainMap, OrderedDict
+from functools import partial
+from types import MappingProxyType
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 import httpx
+import msgspec
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.messages import BaseMessage
@@ -37,6 +52,113 @@ from langchain_core.outputs import LLMResult
 
 logger = logging.getLogger(__name__)
 
+# Sentinel pushed onto the event queue to stop the background flusher.
+_SHUTDOWN = object()
+
+# Upper bound on remembered (type, action, context) fingerprints when
+# deduplication is enabled.
+_DEDUP_MAX_ENTRIES = 1024
+
+# Immutable templates shared by every instance, so __init__ does not
+# rebuild identical dicts per handler.
+_HEADER_TEMPLATE = MappingProxyType({"Content-Type": "application/json"})
+_EMPTY_METADATA: Any = MappingProxyType({})
+
+
+def _shutdown_flusher(event_queue: "queue.Queue[Any]", thread: threading.Thread) -> None:
+    """Ask the flusher thread to drain its queue and stop.
+
+    Module-level so weakref.finalize can call it without keeping the
+    handler alive.
+    """
+    event_queue.put(_SHUTDOWN)
+    thread.join(timeout=10.0)
+
+# Shared pool sizing for every handler in the process. With HTTP/2 the
+# flusher multiplexes concurrent POSTs over a single keep-alive TLS
+# connection instead of paying a TCP+TLS handshake per request.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=90,
+)
+
+# Millisecond-granularity timestamp cache: back-to-back callbacks within
+# the same millisecond reuse the formatted string instead of building a
+# datetime and re-formatting it.
+_ts_cache: list = [0, ""]
+
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO-8601, cached to 1ms."""
+    ns = time.time_ns()
+    if ns - _ts_cache[0] > 1_000_000:
+        _ts_cache[0] = ns
+        _ts_cache[1] = datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+    return _ts_cache[1]
+
+
+# Per-type serializer cache: the probe ladder below runs once per type
+# encountered, after which encoding an instance is a single dict hit.
+_FALLBACK_BY_TYPE: Dict[type, Any] = {}
+
+
+def _default_fallback(obj: Any) -> Any:
+    """Last-resort conversion: instance __dict__, else str()."""
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        return d
+    return str(obj)
+
+
+def _select_fallback(tp: type) -> Any:
+    """Pick the fastest native conversion for a type.
+
+    Pydantic v2 models go through model_dump_json(), whose C-implemented
+    encoder is far faster than .dict() plus a re-walk; its output is
+    spliced into the payload verbatim via msgspec.Raw. Dataclasses and
+    attrs classes are encoded natively by msgspec and never reach this
+    hook.
+    """
+    if hasattr(tp, "model_dump_json"):
+        return lambda obj: msgspec.Raw(obj.model_dump_json().encode())
+    if hasattr(tp, "dict"):
+        return lambda obj: obj.dict()
+    return _default_fallback
+
+
+def _json_fallback(obj: Any) -> Any:
+    """Convert objects msgspec cannot encode natively.
+
+    msgspec handles dicts, lists, primitives, datetimes and UUIDs in C;
+    this hook is only invoked for the remaining leaves.
+    """
+    if isinstance(obj, ChainMap):
+        return dict(obj)
+    tp = type(obj)
+    convert = _FALLBACK_BY_TYPE.get(tp)
+    if convert is None:
+        convert = _select_fallback(tp)
+        _FALLBACK_BY_TYPE[tp] = convert
+    return convert(obj)
+
+
+class DecisionPayload(msgspec.Struct, gc=False, omit_defaults=True):
+    """Wire format for a decision create event.
+
+    Declared once so the field layout is compiled instead of re-hashed as
+    a dict per event; gc=False keeps these short-lived structs out of the
+    cycle collector.
+    """
+
+    id: str
+    agent_id: str
+    type: str
+    action: str
+    status: str
+    context: Any
+    result: Optional[Dict[str, Any]] = None
+
 
 class ContextGraphCallback(BaseCallbackHandler):
     """
@@ -51,6 +173,31 @@ class ContextGraphCallback(BaseCallbackHandler):
     Each captured event is logged with full context for audit trails.
     """
 
+    _SOURCE = "langchain"
+
+    # Fixed-slot storage: cheaper attribute access on the hot callback
+    # path (the base handler still carries a __dict__, so this only
+    # speeds up the attributes declared here).
+    __slots__ = (
+        "api_key",
+        "agent_id",
+        "api_url",
+        "log_llm_calls",
+        "log_chain_calls",
+        "auto_approve",
+        "metadata",
+        "batch_window_ms",
+        "batch_max_size",
+        "dedup_ttl_seconds",
+        "_dedup",
+        "_static_ctx",
+        "_headers",
+        "_queue",
+        "_flusher_thread",
+        "_finalizer",
+        "_run_decisions",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -60,6 +207,9 @@ class ContextGraphCallback(BaseCallbackHandler):
         log_chain_calls: bool = True,
         auto_approve: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        batch_window_ms: int = 50,
+        batch_max_size: int = 64,
+        dedup_ttl_seconds: float = 0.0,
     ):
         """
         Initialize the ContextGraph callback handler.
@@ -72,6 +222,10 @@ class ContextGraphCallback(BaseCallbackHandler):
             log_chain_calls: Whether to log chain executions.
             auto_approve: Automatically approve decisions (for testing).
             metadata: Additional metadata to include with all decisions.
+            batch_window_ms: How long the background flusher waits to fill a batch.
+            batch_max_size: Maximum number of events sent in one batch POST.
+            dedup_ttl_seconds: Reuse the decision ID for identical events seen
+                within this window instead of logging again. 0 disables.
         """
         super().__init__()
 
@@ -81,7 +235,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         self.log_llm_calls = log_llm_calls
         self.log_chain_calls = log_chain_calls
         self.auto_approve = auto_approve
-        self.metadata = metadata or {}
+        self.metadata = dict(metadata) if metadata else _EMPTY_METADATA
 
         if not self.api_key:
             raise ValueError(
@@ -92,17 +246,79 @@ class ContextGraphCallback(BaseCallbackHandler):
                 "ContextGraph agent ID required. Set CG_AGENT_ID env var or pass agent_id."
             )
 
-        self._client = httpx.Client(
-            base_url=self.api_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
+        # Static context fields are merged once; per-event contexts layer on
+        # top via ChainMap instead of copying this dict for every decision.
+        self._static_ctx = {**self.metadata, "source": self._SOURCE}
+
+        self._headers = {**_HEADER_TEMPLATE, "Authorization": f"Bearer {self.api_key}"}
+        self.batch_window_ms = batch_window_ms
+        self.batch_max_size = batch_max_size
+        self.dedup_ttl_seconds = dedup_ttl_seconds
+        self._dedup: "OrderedDict[int, tuple]" = OrderedDict()
+
+        # Events are enqueued here and flushed in batches by a background
+        # thread, so callbacks never block the agent loop on network I/O.
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._flusher_thread = threading.Thread(
+            target=self._run_flusher,
+            name="contextgraph-flusher",
+            daemon=True,
         )
+        self._flusher_thread.start()
 
-        # Track active runs
-        self._run_decisions: Dict[str, str] = {}
+        # Deterministic cleanup: runs on close(), garbage collection, or
+        # interpreter exit, whichever comes first.
+        self._finalizer = weakref.finalize(
+            self, _shutdown_flusher, self._queue, self._flusher_thread
+        )
+
+        # Track active runs keyed by the UUID's 128-bit int: int keys hash
+        # directly and skip a str allocation per callback.
+        self._run_decisions: Dict[int, str] = {}
+
+    # LangChain's callback manager honors these and skips dispatch
+    # entirely for ignored categories, so disabled callbacks cost nothing.
+    @property
+    def ignore_llm(self) -> bool:
+        return not self.log_llm_calls
+
+    @property
+    def ignore_chain(self) -> bool:
+        return not self.log_chain_calls
+
+    @property
+    def ignore_retriever(self) -> bool:
+        return True
+
+    def _dedup_key(self, decision_type: str, action: str, context: Dict[str, Any]) -> int:
+        """Fingerprint an event by type, action and canonical context."""
+        return hash(
+            (
+                decision_type,
+                action,
+                msgspec.json.encode(
+                    context, enc_hook=_json_fallback, order="deterministic"
+                ),
+            )
+        )
+
+    def _dedup_lookup(self, key: int) -> Optional[str]:
+        """Return a live cached decision ID for this fingerprint, if any."""
+        cached = self._dedup.get(key)
+        if cached is None:
+            return None
+        decision_id, expires = cached
+        if expires < time.monotonic():
+            del self._dedup[key]
+            return None
+        self._dedup.move_to_end(key)
+        return decision_id
+
+    def _dedup_store(self, key: int, decision_id: str) -> None:
+        """Remember a decision ID for this fingerprint, evicting LRU-style."""
+        self._dedup[key] = (decision_id, time.monotonic() + self.dedup_ttl_seconds)
+        while len(self._dedup) > _DEDUP_MAX_ENTRIES:
+            self._dedup.popitem(last=False)
 
     def _log_decision(
         self,
@@ -111,54 +327,144 @@ class ContextGraphCallback(BaseCallbackHandler):
         context: Dict[str, Any],
         run_id: Optional[str] = None,
     ) -> Optional[str]:
-        """Log a decision to ContextGraph."""
-        try:
-            payload = {
-                "agent_id": self.agent_id,
-                "type": decision_type,
-                "action": action,
-                "status": "proposed",
-                "context": {
-                    **context,
-                    **self.metadata,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "source": "langchain",
-                },
-            }
+        """Enqueue a decision for batched delivery to ContextGraph."""
+        if self.dedup_ttl_seconds > 0:
+            dedup_key = self._dedup_key(decision_type, action, context)
+            cached = self._dedup_lookup(dedup_key)
+            if cached is not None:
+                return cached
+
+        # IDs are minted client-side so callers can track the decision
+        # immediately without waiting for a server round trip.
+        decision_id = str(uuid.uuid4())
+
+        payload = DecisionPayload(
+            id=decision_id,
+            agent_id=self.agent_id,
+            type=decision_type,
+            action=action,
+            status="proposed",
+            context=ChainMap(
+                {"timestamp": _iso_now()},
+                self._static_ctx,
+                context,
+            ),
+        )
+
+        if run_id:
+            payload.context["run_id"] = run_id
 
-            if run_id:
-                payload["context"]["run_id"] = run_id
+        self._queue.put({"op": "create", "payload": payload})
 
-            response = self._client.post("/v1/decisions", json=payload)
-            response.raise_for_status()
+        if self.dedup_ttl_seconds > 0:
+            self._dedup_store(dedup_key, decision_id)
 
-            decision = response.json()
-            decision_id = decision.get("id")
+        if self.auto_approve:
+            self._transition_decision(decision_id, "approved")
 
-            if self.auto_approve and decision_id:
-                self._transition_decision(decision_id, "approved")
+        return decision_id
 
-            return decision_id
+    def _transition_decision(self, decision_id: str, status: str, result: Optional[Dict] = None):
+        """Enqueue a decision status transition for batched delivery.
+
+        Fire-and-forget: the caller returns immediately and the background
+        flusher performs the POST, so transitions never extend callback
+        latency.
+        """
+        payload = {"status": status}
+        if result:
+            payload["result"] = result
 
-        except Exception as e:
-            logger.error(f"Failed to log decision to ContextGraph: {e}")
+        self._queue.put(
+            {"op": "transition", "decision_id": decision_id, "payload": payload}
+        )
+
+    # ==================== Background Flusher ====================
+
+    def _run_flusher(self) -> None:
+        """Entry point for the background flusher thread."""
+        if uvloop is not None:
+            # libuv-based loop: much lower per-socket overhead than the
+            # default selector loop. Created per-thread rather than via
+            # uvloop.install() so the host application's loop policy is
+            # left alone.
+            loop = uvloop.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self._flusher())
+            finally:
+                loop.close()
+        else:
+            asyncio.run(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain the event queue and POST batches until shutdown."""
+        async with httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=self._headers,
+            timeout=30.0,
+            http2=True,
+            limits=_POOL_LIMITS,
+        ) as client:
+            # Bind the hot POST once: no client.post attribute resolution
+            # or URL parsing per flush.
+            post_batch = partial(client.post, "/v1/decisions:batch")
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                try:
+                    await self._post_batch(post_batch, batch)
+                except Exception as e:
+                    logger.error(f"Failed to flush batch to ContextGraph: {e}")
+
+    def _next_batch(self) -> Optional[List[Dict[str, Any]]]:
+        """Block for the next batch of events, or None on shutdown."""
+        event = self._queue.get()
+        if event is _SHUTDOWN:
             return None
 
-    def _transition_decision(self, decision_id: str, status: str, result: Optional[Dict] = None):
-        """Transition a decision to a new status."""
-        try:
-            payload = {"status": status}
-            if result:
-                payload["result"] = result
-
-            response = self._client.post(
-                f"/v1/decisions/{decision_id}/transition",
-                json=payload
-            )
-            response.raise_for_status()
+        batch = [event]
+        deadline = time.monotonic() + self.batch_window_ms / 1000.0
+
+        while len(batch) < self.batch_max_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _SHUTDOWN:
+                # Put the sentinel back so the next iteration shuts down
+                # after this batch has been flushed.
+                self._queue.put(_SHUTDOWN)
+                break
+            batch.append(event)
+
+        return batch
+
+    async def _post_batch(self, post_batch: Any, batch: List[Dict[str, Any]]) -> None:
+        """POST one queue drain to ContextGraph as a single request.
+
+        Creates and transitions go in one array payload, serialized with a
+        single encode call so there is one Python-to-C crossing and one
+        output buffer per drain; the server applies the items in order.
+        """
+        response = await post_batch(
+            content=msgspec.json.encode(batch, enc_hook=_json_fallback)
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        """Flush pending events and stop the background flusher."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
 
-        except Exception as e:
-            logger.error(f"Failed to transition decision {decision_id}: {e}")
+    def __exit__(self, *exc_info):
+        self.close()
 
     # ==================== Agent Callbacks ====================
 
@@ -176,14 +482,14 @@ class ContextGraphCallback(BaseCallbackHandler):
             action=action.tool,
             context={
                 "tool": action.tool,
-                "tool_input": self._serialize(action.tool_input),
+                "tool_input": action.tool_input,
                 "reasoning": action.log,
             },
             run_id=str(run_id),
         )
 
         if decision_id:
-            self._run_decisions[str(run_id)] = decision_id
+            self._run_decisions[run_id.int] = decision_id
 
     def on_agent_finish(
         self,
@@ -194,14 +500,14 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark agent decision as executed."""
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
                 decision_id,
                 "executed",
                 result={
-                    "output": self._serialize(finish.return_values),
+                    "output": finish.return_values,
                     "log": finish.log,
                 },
             )
@@ -229,7 +535,7 @@ class ContextGraphCallback(BaseCallbackHandler):
             context={
                 "tool": tool_name,
                 "input": input_str,
-                "inputs": self._serialize(inputs),
+                "inputs": inputs,
                 "tags": tags,
                 "metadata": metadata,
             },
@@ -237,7 +543,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         )
 
         if decision_id:
-            self._run_decisions[str(run_id)] = decision_id
+            self._run_decisions[run_id.int] = decision_id
 
     def on_tool_end(
         self,
@@ -248,7 +554,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark tool execution as completed."""
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
@@ -266,7 +572,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark tool execution as failed."""
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
@@ -289,9 +595,6 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Log chain execution start."""
-        if not self.log_chain_calls:
-            return
-
         chain_name = serialized.get("name", serialized.get("id", ["unknown"])[-1])
 
         decision_id = self._log_decision(
@@ -299,7 +602,7 @@ class ContextGraphCallback(BaseCallbackHandler):
             action=chain_name,
             context={
                 "chain": chain_name,
-                "inputs": self._serialize(inputs),
+                "inputs": inputs,
                 "tags": tags,
                 "metadata": metadata,
             },
@@ -307,7 +610,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         )
 
         if decision_id:
-            self._run_decisions[str(run_id)] = decision_id
+            self._run_decisions[run_id.int] = decision_id
 
     def on_chain_end(
         self,
@@ -318,16 +621,13 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark chain execution as completed."""
-        if not self.log_chain_calls:
-            return
-
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
                 decision_id,
                 "executed",
-                result={"outputs": self._serialize(outputs)},
+                result={"outputs": outputs},
             )
 
     def on_chain_error(
@@ -339,10 +639,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark chain execution as failed."""
-        if not self.log_chain_calls:
-            return
-
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
@@ -365,9 +662,6 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Log LLM call start."""
-        if not self.log_llm_calls:
-            return
-
         model_name = serialized.get("name", "unknown_model")
 
         decision_id = self._log_decision(
@@ -383,7 +677,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         )
 
         if decision_id:
-            self._run_decisions[str(run_id)] = decision_id
+            self._run_decisions[run_id.int] = decision_id
 
     def on_llm_end(
         self,
@@ -394,10 +688,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark LLM call as completed."""
-        if not self.log_llm_calls:
-            return
-
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
@@ -420,10 +711,7 @@ class ContextGraphCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Mark LLM call as failed."""
-        if not self.log_llm_calls:
-            return
-
-        decision_id = self._run_decisions.pop(str(run_id), None)
+        decision_id = self._run_decisions.pop(run_id.int, None)
 
         if decision_id:
             self._transition_decision(
@@ -431,26 +719,3 @@ class ContextGraphCallback(BaseCallbackHandler):
                 "failed",
                 result={"error": str(error)},
             )
-
-    # ==================== Utilities ====================
-
-    def _serialize(self, obj: Any) -> Any:
-        """Serialize object for JSON."""
-        if obj is None:
-            return None
-        if isinstance(obj, (str, int, float, bool)):
-            return obj
-        if isinstance(obj, dict):
-            return {k: self._serialize(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple)):
-            return [self._serialize(v) for v in obj]
-        if hasattr(obj, "dict"):
-            return self._serialize(obj.dict())
-        if hasattr(obj, "__dict__"):
-            return self._serialize(obj.__dict__)
-        return str(obj)
-
-    def __del__(self):
-        """Cleanup HTTP client."""
-        if hasattr(self, "_client"):
-            self._client.close()
@@ -21,19 +21,190 @@ Usage:
     )
 """
 
+import asyncio
+import atexit
 import os
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+import uuid
+from collections import ChainMap, OrderedDict
+from contextvars import ContextVar
 from typing import Any, Dict, Optional, Callable, List
-from functools import wraps
+from functools import partial
 
 import httpx
+import msgspec
+
+# Optional: compress request bodies when the zstandard package is present
+# (install with the [zstd] extra). High-volume agents are uplink-bound;
+# JSON decision batches compress several-fold.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Imported once at module load rather than on every factory call.
+try:
+    from langchain.agents.middleware import after_model, before_model, wrap_tool_call
+
+    _HAS_MIDDLEWARE = True
+except ImportError:
+    _HAS_MIDDLEWARE = False
+
+# Sentinel pushed onto the event queue to stop the background worker.
+_SHUTDOWN = object()
+
+# Upper bound on message content carried in a decision payload.
+MAX_MSG_CHARS = 4096
+
+# Pool sizing for the worker's client. With HTTP/2 the worker multiplexes
+# concurrent POSTs over a single keep-alive TLS connection instead of
+# paying a TCP+TLS handshake per request.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60,
+)
+
+# Hard cap on the dedupe LRU so a long-lived agent cannot grow it unbounded.
+_DEDUPE_MAX_ENTRIES = 1024
+
+# Tight transport budget: an unreachable API should cost seconds, not the
+# default 30 s per attempt.
+_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+# Bodies below this size are sent uncompressed; the zstd frame overhead
+# and an extra C call are not worth it for tiny payloads.
+_COMPRESS_MIN_BYTES = 1024
+
+_ZSTD_HEADERS = {"Content-Encoding": "zstd"}
+
+
+# Per-type serializer cache: the probe ladder below runs once per type
+# encountered, after which encoding an instance is a single dict hit.
+_FALLBACK_BY_TYPE: Dict[type, Any] = {}
+
+
+def _default_fallback(obj: Any) -> Any:
+    """Last-resort conversion: instance __dict__, else str()."""
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        return d
+    return str(obj)
+
+
+def _select_fallback(tp: type) -> Any:
+    """Pick the fastest native conversion for a type.
+
+    Pydantic v2 models (LangChain messages included) go through
+    model_dump_json(), whose C-implemented encoder beats .dict() plus a
+    re-walk; its output is spliced into the payload verbatim via
+    msgspec.Raw.
+    """
+    if hasattr(tp, "model_dump_json"):
+        return lambda obj: msgspec.Raw(obj.model_dump_json().encode())
+    if hasattr(tp, "dict"):
+        return lambda obj: obj.dict()
+    return _default_fallback
+
+
+def _json_fallback(obj: Any) -> Any:
+    """Convert objects msgspec cannot encode natively.
+
+    msgspec handles dicts, lists, primitives, datetimes and UUIDs in C;
+    this hook is only invoked for the remaining leaves.
+    """
+    if isinstance(obj, ChainMap):
+        return dict(obj)
+    tp = type(obj)
+    convert = _FALLBACK_BY_TYPE.get(tp)
+    if convert is None:
+        convert = _select_fallback(tp)
+        _FALLBACK_BY_TYPE[tp] = convert
+    return convert(obj)
+
+
+class DecisionPayload(msgspec.Struct, gc=False, omit_defaults=True):
+    """Wire format for a decision create event.
+
+    Declared once so the field layout is compiled instead of re-hashed
+    as a dict per event; gc=False keeps these short-lived structs out of
+    the cycle collector.
+    """
+
+    id: str
+    agent_id: str
+    type: str
+    action: str
+    status: str
+    context: Any
+    result: Optional[Dict[str, Any]] = None
+
+
+class TransitionPayload(msgspec.Struct, gc=False, omit_defaults=True):
+    """Wire format for a decision status transition."""
+
+    status: str
+    result: Optional[Dict[str, Any]] = None
+
+
+class _CircuitBreaker:
+    """Drop-log circuit breaker over consecutive delivery failures.
+
+    After fail_threshold consecutive failures the circuit opens and
+    deliveries are dropped outright for reset_s seconds, so an
+    unreachable or slow API adds bounded latency to the agent instead
+    of a full timeout per event. After reset_s one probe is allowed
+    through; its outcome re-opens or closes the circuit.
+    """
+
+    __slots__ = ("fail_threshold", "reset_s", "_failures", "_opened_at")
+
+    def __init__(self, fail_threshold: int = 5, reset_s: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_s = reset_s
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def open(self) -> bool:
+        if not self._opened_at:
+            return False
+        if time.monotonic() - self._opened_at >= self.reset_s:
+            # Half-open: let one probe through; the next failure re-opens.
+            self._opened_at = 0.0
+            self._failures = self.fail_threshold - 1
+            return False
+        return True
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.fail_threshold:
+            self._opened_at = time.monotonic()
+            logger.warning(
+                "ContextGraph delivery failing; dropping events for %.0fs",
+                self.reset_s,
+            )
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = 0.0
+
 
 class ContextGraphClient:
-    """HTTP client for ContextGraph API."""
+    """HTTP client for ContextGraph API.
+
+    With background=True (the default), decisions are enqueued and shipped
+    in batches by a background worker thread, so log_decision and
+    transition_decision return in microseconds instead of blocking the
+    agent loop on an HTTPS round trip. background=False posts inline and
+    synchronously, which is useful in tests and scripts that need every
+    event delivered before the call returns.
+    """
 
     def __init__(
         self,
@@ -42,21 +213,61 @@ class ContextGraphClient:
         api_url: str = "https://contextgraph-api.fly.dev",
         auto_approve: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
+        background: bool = True,
+        dedupe_window_s: float = 0.0,
+        one_shot: bool = True,
     ):
         self.api_key = api_key
         self.agent_id = agent_id
         self.api_url = api_url.rstrip("/")
         self.auto_approve = auto_approve
+        # With one_shot, auto-approved decisions are created already
+        # approved in a single event instead of a create immediately
+        # chased by a transition. Set False to keep the legacy two-step
+        # flow (e.g. if the audit trail must show both states).
+        self.one_shot = one_shot
         self.metadata = metadata or {}
 
-        self._client = httpx.Client(
-            base_url=self.api_url,
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
+        self.dedupe_window_s = dedupe_window_s
+        # LRU of recent decision fingerprints -> (decision_id, expiry).
+        # Agents re-invoke identical tool calls in loops and retries; within
+        # the window the prior decision_id is reused and no event is sent.
+        self._dedupe: "OrderedDict[int, tuple]" = OrderedDict()
+
+        self.batch_max_size = int(os.environ.get("CG_BATCH_SIZE", "64"))
+        self.batch_window_ms = int(os.environ.get("CG_BATCH_MS", "50"))
+
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Immutable context fragment, merged per event with single C-level
+        # dict operations instead of being rebuilt on every call.
+        self._static_ctx = {**self.metadata, "source": "langchain-v1"}
+
+        self.background = background
+        self._cb = _CircuitBreaker(fail_threshold=5, reset_s=30.0)
+        self._zctx = (
+            zstandard.ZstdCompressor(level=3) if zstandard is not None else None
         )
+        self._sync_client: Optional[httpx.Client] = None
+        self._worker: Optional[threading.Thread] = None
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+        if background:
+            self._worker = threading.Thread(
+                target=self._worker_loop,
+                name="contextgraph-worker",
+                daemon=True,
+            )
+            self._worker.start()
+        else:
+            self._sync_client = httpx.Client(
+                base_url=self.api_url,
+                headers=self._headers,
+                timeout=_TIMEOUT,
+            )
 
     def log_decision(
         self,
@@ -64,56 +275,442 @@ class ContextGraphClient:
         action: str,
         context: Dict[str, Any],
     ) -> Optional[str]:
-        """Log a decision to ContextGraph."""
-        try:
-            payload = {
-                "agent_id": self.agent_id,
-                "type": decision_type,
-                "action": action,
-                "status": "proposed",
-                "context": {
-                    **context,
-                    **self.metadata,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "source": "langchain-v1",
-                },
-            }
-
-            response = self._client.post("/v1/decisions", json=payload)
-            response.raise_for_status()
-
-            decision = response.json()
-            decision_id = decision.get("id")
-
-            if self.auto_approve and decision_id:
-                self.transition_decision(decision_id, "approved")
-
-            return decision_id
+        """Enqueue a decision for batched delivery to ContextGraph."""
+        dedupe_key = None
+        if self.dedupe_window_s > 0:
+            # Fingerprint the raw context before timestamps are merged in,
+            # otherwise no two events would ever collide.
+            dedupe_key = hash(
+                (
+                    decision_type,
+                    action,
+                    msgspec.json.encode(
+                        context, enc_hook=_json_fallback, order="deterministic"
+                    ),
+                )
+            )
+            cached = self._dedupe.get(dedupe_key)
+            if cached is not None:
+                cached_id, expires_at = cached
+                if time.monotonic() < expires_at:
+                    self._dedupe.move_to_end(dedupe_key)
+                    return cached_id
+                del self._dedupe[dedupe_key]
+
+        # IDs are minted client-side so callers can reference the decision
+        # immediately without waiting for a server round trip.
+        decision_id = str(uuid.uuid4())
+
+        # ChainMap layers the per-event fields over the call context over
+        # the static metadata without copying any of them; the encoder
+        # hook flattens it during serialization. First map wins, so the
+        # precedence (event fields > context > metadata) is unchanged.
+        # Integer epoch-ms: one clock read, no float rounding, no string
+        # formatting; the server renders ISO8601 where a human needs it.
+        ctx = ChainMap(
+            {"timestamp_ms": time.time_ns() // 1_000_000},
+            context,
+            self._static_ctx,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to log decision to ContextGraph: {e}")
-            return None
+        one_shot_approved = self.auto_approve and self.one_shot
+        payload = DecisionPayload(
+            id=decision_id,
+            agent_id=self.agent_id,
+            type=decision_type,
+            action=action,
+            status="approved" if one_shot_approved else "proposed",
+            context=ctx,
+        )
+
+        if self.background:
+            self._queue.put({"op": "create", "payload": payload})
+        else:
+            if self._cb.open:
+                return None
+            try:
+                body, extra = self._maybe_compress(
+                    msgspec.json.encode(payload, enc_hook=_json_fallback)
+                )
+                response = self._sync_client.post(
+                    "/v1/decisions", content=body, headers=extra
+                )
+                response.raise_for_status()
+                self._cb.record_success()
+            except Exception as e:
+                self._cb.record_failure()
+                logger.error(f"Failed to log decision to ContextGraph: {e}")
+                return None
+
+        if dedupe_key is not None:
+            self._dedupe[dedupe_key] = (
+                decision_id,
+                time.monotonic() + self.dedupe_window_s,
+            )
+            if len(self._dedupe) > _DEDUPE_MAX_ENTRIES:
+                self._dedupe.popitem(last=False)
+
+        if self.auto_approve and not one_shot_approved:
+            self.transition_decision(decision_id, "approved")
+
+        return decision_id
+
+    def log_terminal_decision(
+        self,
+        decision_type: str,
+        action: str,
+        context: Dict[str, Any],
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Log a decision that is already in a terminal state.
+
+        Callers that know the outcome when they log (the common
+        successful-tool-call path) don't need the proposed->executed
+        pair; one event with the final status halves the event count.
+        """
+        decision_id = str(uuid.uuid4())
+
+        payload = DecisionPayload(
+            id=decision_id,
+            agent_id=self.agent_id,
+            type=decision_type,
+            action=action,
+            status=status,
+            context=ChainMap(
+                {"timestamp_ms": time.time_ns() // 1_000_000},
+                context,
+                self._static_ctx,
+            ),
+            result=result,
+        )
+
+        if self.background:
+            self._queue.put({"op": "create", "payload": payload})
+        else:
+            if self._cb.open:
+                return None
+            try:
+                body, extra = self._maybe_compress(
+                    msgspec.json.encode(payload, enc_hook=_json_fallback)
+                )
+                response = self._sync_client.post(
+                    "/v1/decisions", content=body, headers=extra
+                )
+                response.raise_for_status()
+                self._cb.record_success()
+            except Exception as e:
+                self._cb.record_failure()
+                logger.error(f"Failed to log decision to ContextGraph: {e}")
+                return None
+
+        return decision_id
 
     def transition_decision(
         self, decision_id: str, status: str, result: Optional[Dict] = None
     ):
-        """Transition a decision to a new status."""
-        try:
-            payload = {"status": status}
-            if result:
-                payload["result"] = result
+        """Enqueue a decision status transition for batched delivery."""
+        payload = TransitionPayload(status=status, result=result or None)
 
-            response = self._client.post(
-                f"/v1/decisions/{decision_id}/transition", json=payload
+        if self.background:
+            self._queue.put(
+                {"op": "transition", "decision_id": decision_id, "payload": payload}
             )
-            response.raise_for_status()
+        else:
+            if self._cb.open:
+                return
+            try:
+                body, extra = self._maybe_compress(
+                    msgspec.json.encode(payload, enc_hook=_json_fallback)
+                )
+                response = self._sync_client.post(
+                    f"/v1/decisions/{decision_id}/transition",
+                    content=body,
+                    headers=extra,
+                )
+                response.raise_for_status()
+                self._cb.record_success()
+            except Exception as e:
+                self._cb.record_failure()
+                logger.error(f"Failed to transition decision {decision_id}: {e}")
+
+    # ==================== Background Worker ====================
+
+    def _maybe_compress(self, body: bytes):
+        """Compress a request body when zstandard is available and it pays.
+
+        Returns (body, extra_headers); extra_headers is None when the
+        body is sent as-is.
+        """
+        if self._zctx is not None and len(body) > _COMPRESS_MIN_BYTES:
+            return self._zctx.compress(body), _ZSTD_HEADERS
+        return body, None
+
+    def _worker_loop(self) -> None:
+        """Entry point for the background worker thread."""
+        asyncio.run(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain the event queue and POST batches until shutdown."""
+        async with httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=self._headers,
+            timeout=_TIMEOUT,
+            http2=True,
+            limits=_POOL_LIMITS,
+        ) as client:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                if self._cb.open:
+                    # Drop the batch rather than queueing more latency
+                    # behind a broken upstream.
+                    continue
+                try:
+                    body, extra = self._maybe_compress(
+                        msgspec.json.encode(batch, enc_hook=_json_fallback)
+                    )
+                    response = await client.post(
+                        "/v1/decisions:batch", content=body, headers=extra
+                    )
+                    response.raise_for_status()
+                    self._cb.record_success()
+                except Exception as e:
+                    self._cb.record_failure()
+                    logger.error(
+                        f"Failed to flush decision batch to ContextGraph: {e}"
+                    )
 
-        except Exception as e:
-            logger.error(f"Failed to transition decision {decision_id}: {e}")
+    def _next_batch(self) -> Optional[List[Dict[str, Any]]]:
+        """Block for the next batch of events, or None on shutdown."""
+        event = self._queue.get()
+        if event is _SHUTDOWN:
+            return None
+
+        batch = [event]
+        deadline = time.monotonic() + self.batch_window_ms / 1000.0
+
+        while len(batch) < self.batch_max_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                event = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _SHUTDOWN:
+                # Put the sentinel back so the next iteration shuts down
+                # after this batch has been flushed.
+                self._queue.put(_SHUTDOWN)
+                break
+            batch.append(event)
+
+        return batch
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """Flush pending events and release transport resources."""
+        if self._worker is not None:
+            self._queue.put(_SHUTDOWN)
+            self._worker.join(timeout=10.0)
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+
+# Clients interned by contextgraph_middleware, one per API target + agent.
+# Rebuilding agents in a loop (tests, notebooks) then reuses the existing
+# worker thread and its keep-alive connection pool instead of paying a new
+# thread plus TLS handshake per rebuild.
+_CLIENTS: Dict[tuple, ContextGraphClient] = {}
+
+
+def _get_client(
+    api_key: str,
+    agent_id: str,
+    api_url: str,
+    **kwargs: Any,
+) -> ContextGraphClient:
+    """Return the shared client for (api_url, api_key, agent_id).
+
+    The first call for a given key fixes the remaining configuration;
+    later calls with different kwargs reuse the existing client as-is.
+    """
+    key = (api_url, api_key, agent_id)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = _CLIENTS.setdefault(
+            key,
+            ContextGraphClient(
+                api_key=api_key, agent_id=agent_id, api_url=api_url, **kwargs
+            ),
+        )
+    return client
+
+
+def _close_clients() -> None:
+    """Flush and close every interned client at interpreter exit."""
+    for client in _CLIENTS.values():
+        client.close()
+
+
+atexit.register(_close_clients)
+
+
+def _brief(message: Any) -> Dict[str, Any]:
+    """Compact, size-bounded summary of a LangChain message.
+
+    str() on a large message re-materializes the whole content (twice per
+    model turn, once in each hook); extracting type plus a capped content
+    slice keeps both CPU and payload bytes bounded.
+    """
+    content = getattr(message, "content", None)
+    if not isinstance(content, str):
+        content = str(message if content is None else content)
+    return {
+        "type": getattr(message, "type", type(message).__name__),
+        "content": content[:MAX_MSG_CHARS],
+    }
+
+
+# Decision ID of the in-flight model call. A ContextVar rather than a
+# shared dict: concurrent agent runs in one process each see their own
+# value, so parallel runs cannot clobber each other's IDs.
+_MODEL_DECISION: ContextVar[Optional[str]] = ContextVar(
+    "cg_model_decision", default=None
+)
+
+
+def _log_model_start(client: ContextGraphClient, state, runtime) -> None:
+    """Log a model call to ContextGraph."""
+    messages = state.get("messages", [])
+    decision_id = client.log_decision(
+        decision_type="model_call",
+        action="invoke_model",
+        context={
+            "message_count": len(messages),
+            "last_message": _brief(messages[-1]) if messages else None,
+        },
+    )
+    if decision_id:
+        _MODEL_DECISION.set(decision_id)
+
+
+def _log_model_end(client: ContextGraphClient, state, runtime) -> None:
+    """Mark the model call as executed."""
+    decision_id = _MODEL_DECISION.get()
+    if decision_id:
+        _MODEL_DECISION.set(None)
+        messages = state.get("messages", [])
+        client.transition_decision(
+            decision_id,
+            "executed",
+            result={
+                "response": _brief(messages[-1]) if messages else None,
+            },
+        )
+
+
+def _bounded_output(result: Any, max_bytes: int) -> Dict[str, Any]:
+    """Cap the encoded size of a tool result carried in a transition.
+
+    Tools can return multi-MB text (search results, document loaders);
+    encoding once here and slicing the bytes keeps that off the wire and
+    out of the batch queue. Results under the limit pass through intact.
+    """
+    try:
+        encoded = msgspec.json.encode(result, enc_hook=_json_fallback)
+    except Exception:
+        encoded = str(result).encode("utf-8", errors="replace")
+    if len(encoded) <= max_bytes:
+        return {"output": result}
+    return {
+        "output_preview": encoded[:max_bytes].decode("utf-8", errors="replace"),
+        "output_truncated": True,
+        "output_bytes": len(encoded),
+    }
+
+
+def _log_tool_execution(
+    client: ContextGraphClient,
+    max_result_bytes: int,
+    defer_log: bool,
+    tool_call,
+    state,
+    runtime,
+    call_next,
+):
+    """Wrap tool calls with ContextGraph logging.
+
+    Plain callable rather than a generator: the middleware runner invokes
+    it once and we call through via call_next, avoiding the send()/throw()
+    generator protocol on every tool invocation.
+
+    With defer_log, nothing is sent until the tool returns: the success
+    path emits one fused decision already in the executed state instead
+    of a create followed by a transition. A failure still produces the
+    propose/failed pair so the record shows what was attempted.
+    """
+    tool_name = tool_call.get("name", "unknown_tool")
+    tool_input = tool_call.get("args", {})
+    context = {
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+    }
+
+    if defer_log:
+        try:
+            result = call_next(tool_call)
+        except Exception as e:
+            decision_id = client.log_decision(
+                decision_type="tool_execution",
+                action=tool_name,
+                context=context,
+            )
+            if decision_id:
+                client.transition_decision(
+                    decision_id,
+                    "failed",
+                    result={"error": str(e)},
+                )
+            raise
+
+        client.log_terminal_decision(
+            decision_type="tool_execution",
+            action=tool_name,
+            context=context,
+            status="executed",
+            result=_bounded_output(result, max_result_bytes),
+        )
+        return result
+
+    # Log decision before tool execution
+    decision_id = client.log_decision(
+        decision_type="tool_execution",
+        action=tool_name,
+        context=context,
+    )
+
+    try:
+        result = call_next(tool_call)
+    except Exception as e:
+        # Mark as failed on error
+        if decision_id:
+            client.transition_decision(
+                decision_id,
+                "failed",
+                result={"error": str(e)},
+            )
+        raise
+
+    # Mark as executed on success
+    if decision_id:
+        client.transition_decision(
+            decision_id,
+            "executed",
+            result=_bounded_output(result, max_result_bytes),
+        )
+
+    return result
 
 
 def contextgraph_middleware(
@@ -124,6 +721,11 @@ def contextgraph_middleware(
     log_model_calls: bool = True,
     log_tool_calls: bool = True,
     metadata: Optional[Dict[str, Any]] = None,
+    background: bool = True,
+    dedupe_window_s: float = 0.0,
+    max_result_bytes: int = 64 * 1024,
+    defer_log: bool = True,
+    client: Optional[ContextGraphClient] = None,
 ) -> List[Callable]:
     """
     Create ContextGraph middleware for LangChain v1 agents.
@@ -138,6 +740,17 @@ def contextgraph_middleware(
         log_model_calls: Whether to log model calls.
         log_tool_calls: Whether to log tool calls.
         metadata: Additional metadata to include with all decisions.
+        background: Deliver events via the batching worker (default) instead
+            of blocking on a POST per event.
+        dedupe_window_s: Reuse the prior decision for identical events seen
+            within this many seconds instead of logging again. 0 disables.
+        max_result_bytes: Truncate tool outputs larger than this (encoded)
+            to a preview instead of shipping them whole.
+        defer_log: Log successful tool calls as one fused terminal event
+            after the tool returns. Set False to record the proposed
+            state before every tool runs.
+        client: Use this pre-configured ContextGraphClient instead of
+            resolving credentials and building (or interning) one.
 
     Returns:
         List of middleware functions for create_agent().
@@ -155,145 +768,62 @@ def contextgraph_middleware(
             )
         )
     """
-    resolved_api_key = api_key or os.environ.get("CG_API_KEY")
-    resolved_agent_id = agent_id or os.environ.get("CG_AGENT_ID")
-
-    if not resolved_api_key:
-        raise ValueError(
-            "ContextGraph API key required. Set CG_API_KEY env var or pass api_key."
-        )
-    if not resolved_agent_id:
-        raise ValueError(
-            "ContextGraph agent ID required. Set CG_AGENT_ID env var or pass agent_id."
+    # With everything disabled (or no middleware API to hook) there is
+    # nothing to wire up — return before touching credentials or building
+    # a client and its worker thread.
+    if not (log_model_calls or log_tool_calls):
+        return []
+
+    if not _HAS_MIDDLEWARE:
+        logger.warning(
+            "LangChain v1 middleware not available. "
+            "Install langchain>=1.0.0 for middleware support."
         )
+        return []
 
-    client = ContextGraphClient(
-        api_key=resolved_api_key,
-        agent_id=resolved_agent_id,
-        api_url=api_url,
-        auto_approve=auto_approve,
-        metadata=metadata,
-    )
+    if client is None:
+        resolved_api_key = api_key or os.environ.get("CG_API_KEY")
+        resolved_agent_id = agent_id or os.environ.get("CG_AGENT_ID")
 
-    # Track active decisions
-    active_decisions: Dict[str, str] = {}
+        if not resolved_api_key:
+            raise ValueError(
+                "ContextGraph API key required. Set CG_API_KEY env var or pass api_key."
+            )
+        if not resolved_agent_id:
+            raise ValueError(
+                "ContextGraph agent ID required. Set CG_AGENT_ID env var or pass agent_id."
+            )
+
+        client = _get_client(
+            api_key=resolved_api_key,
+            agent_id=resolved_agent_id,
+            api_url=api_url,
+            auto_approve=auto_approve,
+            metadata=metadata,
+            background=background,
+            dedupe_window_s=dedupe_window_s,
+        )
 
     middlewares = []
 
     if log_model_calls:
-        # Import LangChain middleware decorators
-        try:
-            from langchain.agents.middleware import before_model, after_model
-
-            @before_model
-            def log_model_start(state, runtime) -> None:
-                """Log model call to ContextGraph."""
-                messages = state.get("messages", [])
-                decision_id = client.log_decision(
-                    decision_type="model_call",
-                    action="invoke_model",
-                    context={
-                        "message_count": len(messages),
-                        "last_message": str(messages[-1]) if messages else None,
-                    },
-                )
-                if decision_id:
-                    active_decisions["model"] = decision_id
-
-            @after_model
-            def log_model_end(state, runtime) -> None:
-                """Mark model call as executed."""
-                decision_id = active_decisions.pop("model", None)
-                if decision_id:
-                    messages = state.get("messages", [])
-                    client.transition_decision(
-                        decision_id,
-                        "executed",
-                        result={
-                            "response": str(messages[-1]) if messages else None,
-                        },
-                    )
-
-            middlewares.extend([log_model_start, log_model_end])
-
-        except ImportError:
-            logger.warning(
-                "LangChain v1 middleware not available. "
-                "Install langchain>=1.0.0 for middleware support."
-            )
+        middlewares.extend(
+            [
+                before_model(partial(_log_model_start, client)),
+                after_model(partial(_log_model_end, client)),
+            ]
+        )
 
     if log_tool_calls:
-        try:
-            from langchain.agents.middleware import wrap_tool_call
-
-            @wrap_tool_call
-            def log_tool_execution(tool_call, state, runtime):
-                """Wrap tool calls with ContextGraph logging."""
-                tool_name = tool_call.get("name", "unknown_tool")
-                tool_input = tool_call.get("args", {})
-
-                # Log decision before tool execution
-                decision_id = client.log_decision(
-                    decision_type="tool_execution",
-                    action=tool_name,
-                    context={
-                        "tool_name": tool_name,
-                        "tool_input": _serialize(tool_input),
-                    },
-                )
-
-                try:
-                    # Execute the tool (yield control back to LangChain)
-                    result = yield tool_call
-
-                    # Mark as executed on success
-                    if decision_id:
-                        client.transition_decision(
-                            decision_id,
-                            "executed",
-                            result={"output": _serialize(result)},
-                        )
-
-                    return result
-
-                except Exception as e:
-                    # Mark as failed on error
-                    if decision_id:
-                        client.transition_decision(
-                            decision_id,
-                            "failed",
-                            result={"error": str(e)},
-                        )
-                    raise
-
-            middlewares.append(log_tool_execution)
-
-        except ImportError:
-            logger.warning(
-                "LangChain v1 middleware not available. "
-                "Install langchain>=1.0.0 for middleware support."
+        middlewares.append(
+            wrap_tool_call(
+                partial(_log_tool_execution, client, max_result_bytes, defer_log)
             )
+        )
 
     return middlewares
 
 
-def _serialize(obj: Any) -> Any:
-    """Serialize object for JSON."""
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_serialize(v) for v in obj]
-    if hasattr(obj, "dict"):
-        return _serialize(obj.dict())
-    if hasattr(obj, "__dict__"):
-        return _serialize(obj.__dict__)
-    return str(obj)
-
-
 # ============================================================
 # Legacy Callback Handler (for LangChain < 1.0 compatibility)
 # ============================================================
@@ -1,5 +1,20 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Opt-in compiled fast path: build the hot modules as C extensions with
+# mypyc (typed attribute access, inlined isinstance checks). Pure Python
+# remains the default; wheels built with CONTEXTGRAPH_MYPYC=1 ship the
+# extension and fall back transparently when it is absent.
+ext_modules = []
+if os.environ.get("CONTEXTGRAPH_MYPYC"):
+    try:
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify(["contextgraph_callback.py", "contextgraph_middleware.py"])
+    except ImportError:
+        pass
+
 setup(
     name="contextgraph-langchain",
     version="0.1.0",
@@ -10,24 +25,29 @@ setup(
     author_email="blog.mot2gmob@gmail.com",
     url="https://github.com/akz4ol/contextgraph-integrations",
     packages=find_packages(),
+    ext_modules=ext_modules,
     py_modules=["contextgraph_callback", "contextgraph_middleware"],
     install_requires=[
         "langchain>=1.0.0",
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
+        "msgspec>=0.18.0",
+        'uvloop>=0.17.0; platform_system != "Windows"',
     ],
     extras_require={
+        "zstd": [
+            "zstandard>=0.21.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
         ],
     },
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",